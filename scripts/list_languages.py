@@ -15,11 +15,12 @@ if not os.path.isdir(locales_dir):
     exit(1)
 
 combinations: List[str] = []
-for lang in sorted(os.listdir(locales_dir)):
-    lang_path = os.path.join(locales_dir, lang)
-    if not os.path.isdir(lang_path) or lang.startswith("."):
-        continue
-    raw_regions: List[str] = [r for r in os.listdir(lang_path) if os.path.isdir(os.path.join(lang_path, r)) and not r.startswith(".")]
+with os.scandir(locales_dir) as it:
+    lang_entries = sorted((e for e in it if e.is_dir() and not e.name.startswith(".")), key=lambda e: e.name)
+for lang_entry in lang_entries:
+    lang = lang_entry.name
+    with os.scandir(lang_entry.path) as it:
+        raw_regions: List[str] = [r.name for r in it if r.is_dir() and not r.name.startswith(".")]
     if raw_regions:
         by_canon: Dict[str, str] = {}
         for r in raw_regions:
@@ -1,5 +1,5 @@
 # pyright: reportUntypedClassDecorator=false, reportUntypedBaseClass=false, reportUnknownMemberType=false, reportUnknownParameterType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
-from typing import Any, Dict, List, Text, cast
+from typing import Any, Dict, List, Text, Tuple, cast
 
 from rasa.engine.graph import GraphComponent  # type: ignore
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe  # type: ignore
@@ -17,6 +17,15 @@ class CLIIntentSetter(GraphComponent):
             merged.update(config)
         self._config = merged
 
+        prefixes_any: Any = merged.get("prefixes", ["/cli"])
+        if isinstance(prefixes_any, list):
+            self._prefixes: Tuple[str, ...] = tuple(str(item) for item in cast(List[Any], prefixes_any))
+        else:
+            self._prefixes = (str(prefixes_any),)
+
+        intent_name_any: Any = merged.get("intent_name", "cli_command")
+        self._intent_name: str = intent_name_any if isinstance(intent_name_any, str) else str(intent_name_any)
+
     @classmethod
     def create(
         cls,
@@ -28,32 +37,24 @@ class CLIIntentSetter(GraphComponent):
         return cls(config)
 
     def process(self, messages: List[Message]) -> List[Message]:  # type: ignore[override]
-        prefixes_any: Any = self._config.get("prefixes", ["/cli"])
-        prefixes: List[str] = []
-        if isinstance(prefixes_any, list):
-            prefixes_list: List[Any] = cast(List[Any], prefixes_any)
-            for item in prefixes_list:
-                prefixes.append(str(item))
-        else:
-            prefixes = [str(prefixes_any)]
-
-        intent_name_any: Any = self._config.get("intent_name", "cli_command")
-        intent_name: str = intent_name_any if isinstance(intent_name_any, str) else str(intent_name_any)
+        prefixes = self._prefixes
+        intent_name = self._intent_name
 
         for message_any in cast(List[Any], messages):
             text: str = str(message_any.get("text") or "").strip()
-            for prefix in prefixes:
-                if text.startswith(prefix):
-                    trimmed: str = text[len(prefix) :].strip()
-                    message_any.set("intent", {"name": intent_name, "confidence": 1.0}, add_to_output=True)
-                    message_any.set(
-                        "intent_ranking",
-                        [{"name": intent_name, "confidence": 1.0}],
-                        add_to_output=True,
-                    )
-                    md_any: Any = message_any.get("metadata")
-                    md: Dict[str, Any] = dict(cast(Dict[str, Any], md_any)) if isinstance(md_any, dict) else {}
-                    md["cli_command_text"] = trimmed
-                    message_any.set("metadata", md, add_to_output=True)
-                    break
+            # Single C-level check rejects the common non-CLI message; then find the first configured prefix.
+            if not text.startswith(prefixes):
+                continue
+            prefix = next(p for p in prefixes if text.startswith(p))
+            trimmed: str = text[len(prefix) :].strip()
+            message_any.set("intent", {"name": intent_name, "confidence": 1.0}, add_to_output=True)
+            message_any.set(
+                "intent_ranking",
+                [{"name": intent_name, "confidence": 1.0}],
+                add_to_output=True,
+            )
+            md_any: Any = message_any.get("metadata")
+            md: Dict[str, Any] = dict(cast(Dict[str, Any], md_any)) if isinstance(md_any, dict) else {}
+            md["cli_command_text"] = trimmed
+            message_any.set("metadata", md, add_to_output=True)
         return messages
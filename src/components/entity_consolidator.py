@@ -1,6 +1,7 @@
 # pyright: reportUntypedClassDecorator=false, reportUntypedBaseClass=false, reportUnknownMemberType=false, reportUnknownParameterType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
 import logging
-from typing import Any, Dict, List, Optional, Text, Tuple, cast
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, cast
 
 from rasa.engine.graph import ExecutionContext, GraphComponent  # type: ignore
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe  # type: ignore
@@ -10,6 +11,17 @@ from rasa.shared.nlu.training_data.message import Message  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+_UNHASHABLE = object()
+
+
+def _bucket_key(entity_type: Any, role: Any, value: Any) -> Tuple[Any, ...]:
+    """Bucket key for overlap matching; unhashable values (e.g. dicts) share one bucket per type/role."""
+    try:
+        hash(value)
+    except TypeError:
+        value = _UNHASHABLE
+    return (entity_type, role, value)
+
 
 @DefaultV1Recipe.register(DefaultV1Recipe.ComponentType.ENTITY_EXTRACTOR, is_trainable=False)
 class EntityConsolidator(GraphComponent):
@@ -29,6 +41,20 @@ class EntityConsolidator(GraphComponent):
         self._collect_stats = config.get("collect_stats", False)
         self._stats: Dict[str, float] = {"total_processed": 0.0, "total_consolidated": 0.0, "consolidation_ratio": 0.0}
 
+        # Resolve the consolidation key into its extractors once; role and start/end only
+        # contribute when role awareness / exact position matching are enabled.
+        key_extractors: Dict[str, Callable[[Dict[str, Any], List[Any]], None]] = {
+            "entity": self._key_entity,
+            "value": self._key_value,
+            "position_range": self._key_position_range,
+        }
+        if self._role_aware:
+            key_extractors["role"] = self._key_role
+        if self._position_matching == "exact":
+            key_extractors["start"] = self._key_start
+            key_extractors["end"] = self._key_end
+        self._key_extractors = tuple(key_extractors[c] for c in self._consolidation_key if c in key_extractors)
+
         if self._position_matching not in ["exact", "overlap", "ignore"]:
             raise ValueError(f"Invalid position_matching: {self._position_matching}")
 
@@ -38,6 +64,11 @@ class EntityConsolidator(GraphComponent):
         if self._position_tolerance < 0:
             raise ValueError(f"position_tolerance must be >= 0, got {self._position_tolerance}")
 
+        # Threshold as an exact ratio of its decimal form, so overlap checks are an integer cross-multiplication.
+        threshold = Fraction(str(float(self._overlap_threshold)))
+        self._overlap_num = threshold.numerator
+        self._overlap_den = threshold.denominator
+
     @classmethod
     def create(
         cls,
@@ -100,35 +131,36 @@ class EntityConsolidator(GraphComponent):
             if min_length == 0:
                 return overlap_length > 0
 
-            overlap_ratio = overlap_length / min_length
-            return overlap_ratio >= self._overlap_threshold
+            return overlap_length * self._overlap_den >= min_length * self._overlap_num
 
         return False
 
+    def _key_entity(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        key_parts.append(ent.get("entity"))
+
+    def _key_value(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        key_parts.append(self._normalize_value(ent.get("value")))
+
+    def _key_role(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        key_parts.append(ent.get("role"))
+
+    def _key_start(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        key_parts.append(ent.get("start"))
+
+    def _key_end(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        key_parts.append(ent.get("end"))
+
+    def _key_position_range(self, ent: Dict[str, Any], key_parts: List[Any]) -> None:
+        start, end = ent.get("start"), ent.get("end")
+        if start is not None and end is not None:
+            key_parts.append(f"{start // 10}-{end // 10}")
+
     def _generate_key(self, ent: Dict[str, Any]) -> Tuple[Any, ...]:
         """Generate consolidation key based on configuration."""
         key_parts: List[Any] = []
 
-        for key_component in self._consolidation_key:
-            if key_component == "entity":
-                key_parts.append(ent.get("entity"))
-            elif key_component == "value":
-                value = ent.get("value")
-                key_parts.append(self._normalize_value(value))
-            elif key_component == "role":
-                if self._role_aware:
-                    key_parts.append(ent.get("role"))
-            elif key_component == "start":
-                if self._position_matching == "exact":
-                    key_parts.append(ent.get("start"))
-            elif key_component == "end":
-                if self._position_matching == "exact":
-                    key_parts.append(ent.get("end"))
-            elif key_component == "position_range":
-                start, end = ent.get("start"), ent.get("end")
-                if start is not None and end is not None:
-                    range_key = f"{start // 10}-{end // 10}"
-                    key_parts.append(range_key)
+        for extractor in self._key_extractors:
+            extractor(ent, key_parts)
 
         return tuple(key_parts)
 
@@ -136,7 +168,10 @@ class EntityConsolidator(GraphComponent):
         """Consolidate entities based on configuration."""
         original_count = len(entities)
 
-        if self._position_matching in ["exact", "ignore"]:
+        if original_count == 1:
+            # Nothing to merge with; skip key generation and bucketing.
+            result = [self._create_consolidated_entity(entities[0])]
+        elif self._position_matching in ["exact", "ignore"]:
             result = self._consolidate_by_key(entities)
         else:
             result = self._consolidate_by_overlap(entities)
@@ -167,20 +202,31 @@ class EntityConsolidator(GraphComponent):
         return list(consolidated.values())
 
     def _consolidate_by_overlap(self, entities: List[Dict[Text, Any]]) -> List[Dict[Text, Any]]:
-        """Consolidate entities using overlap-based matching."""
+        """Consolidate entities using overlap-based matching.
+
+        Consolidated entities are bucketed by entity type, role and normalized value, so each
+        incoming entity is only position-checked against the ones it could actually merge with.
+        """
         consolidated: List[Dict[str, Any]] = []
+        buckets: Dict[Tuple[Any, ...], List[Tuple[Dict[str, Any], Any]]] = {}
 
         for ent in entities:
-            merged = False
+            entity_type = ent.get("entity")
+            value = self._normalize_value(ent.get("value"))
+            role = ent.get("role") if self._role_aware else None
 
-            for existing in consolidated:
-                if ent.get("entity") == existing.get("entity") and (not self._role_aware or ent.get("role") == existing.get("role")) and self._normalize_value(ent.get("value")) == self._normalize_value(existing.get("value")) and self._positions_match(ent, existing):
+            merged = False
+            for existing, existing_value in buckets.get(_bucket_key(entity_type, role, value), ()):
+                if existing_value == value and self._positions_match(ent, existing):
                     self._merge_entity_data(existing, ent)
                     merged = True
                     break
 
             if not merged:
-                consolidated.append(self._create_consolidated_entity(ent))
+                created = self._create_consolidated_entity(ent)
+                consolidated.append(created)
+                created_role = created.get("role") if self._role_aware else None
+                buckets.setdefault(_bucket_key(entity_type, created_role, value), []).append((created, value))
 
         return consolidated
 
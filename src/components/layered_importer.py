@@ -1,12 +1,15 @@
 # pyright: reportMissingTypeStubs=false, reportMissingModuleSource=false
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import stat
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
 import yaml  # type: ignore[import-untyped]  # pyright: ignore[reportMissingModuleSource, reportMissingTypeStubs]
 from rasa.shared.core.domain import Domain  # type: ignore
@@ -19,49 +22,98 @@ try:  # story reader imports (robust across minor Rasa versions)
 except Exception:  # pragma: no cover
     YAMLStoryReader = None  # type: ignore
 
+try:  # in-memory NLU parsing; falls back to a temp file + load_data
+    from rasa.shared.nlu.training_data.formats.rasa_yaml import RasaYAMLReader  # type: ignore
+except Exception:  # pragma: no cover
+    RasaYAMLReader = None  # type: ignore
+
 ADD = "add"
 REPLACE = "replace"
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("OverlayImporter")
 
+# libyaml-backed loader/dumper when available, pure-Python otherwise.
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+_YAML_EXT = (".yml", ".yaml")
+
+
+def _is_yaml_name(name: str) -> bool:
+    # Same as Path(name).suffix.lower() in {".yml", ".yaml"}; a bare ".yml" has no suffix.
+    lowered = name.lower()
+    return lowered.endswith(_YAML_EXT) and lowered not in _YAML_EXT
+
+
+def _walk_yaml(root: str) -> Iterator[str]:
+    """Yield YAML file paths under root in rglob order: each directory's entries, then its subdirectories."""
+    stack = [root]
+    while stack:
+        subdirs: List[str] = []
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            # rglob silently skips directories it cannot read
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif _is_yaml_name(e.name):
+                    yield e.path
+        stack.extend(reversed(subdirs))
+
 
 def _iter_yaml_files(path: Path) -> List[Path]:
     if path.is_file():
-        return [path] if path.suffix.lower() in {".yml", ".yaml"} else []
+        return [path] if _is_yaml_name(path.name) else []
     if path.is_dir():
-        return [p for p in path.rglob("*") if p.suffix.lower() in {".yml", ".yaml"}]
+        return [Path(p) for p in _walk_yaml(str(path))]
     return []
 
 
-def _load_yaml_docs(paths: Iterable[Path]) -> List[Dict[str, Any]]:
+def _load_yaml_docs(paths: Iterable[str], markers: Tuple[bytes, ...] = ()) -> List[Dict[str, Any]]:
+    """Load YAML mappings from files and directories.
+
+    With ``markers``, files whose raw bytes contain none of them are skipped unparsed.
+    """
     docs: List[Dict[str, Any]] = []
-    files: List[Path] = []
+    files: List[Tuple[str, os.stat_result]] = []
     for p in paths:
-        if p.exists():
-            if p.is_file():
-                files.append(p)
-            elif p.is_dir():
-                files.extend(_iter_yaml_files(p))
-    for fpath in files:
-        with fpath.open("r", encoding="utf-8") as f:
-            doc_any = yaml.safe_load(f)
-            if isinstance(doc_any, dict):
-                docs.append(cast(Dict[str, Any], doc_any))
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            files.append((p, st))
+        elif stat.S_ISDIR(st.st_mode):
+            files.extend((f, os.stat(f)) for f in _walk_yaml(p))
+    loaded = [_load_yaml_file_cached(fpath, st.st_mtime_ns, st.st_size, markers) for fpath, st in files]
+    for doc_any in loaded:
+        if isinstance(doc_any, dict):
+            docs.append(cast(Dict[str, Any], doc_any))
     return docs
 
 
-def _has_yaml_under(path: Path) -> bool:
-    if path.is_file():
-        return path.suffix.lower() in {".yml", ".yaml"}
-    if path.is_dir():
-        for p in path.rglob("*"):
-            if p.suffix.lower() in {".yml", ".yaml"}:
-                return True
-    return False
+@lru_cache(maxsize=256)
+def _load_yaml_file_cached(path_str: str, mtime_ns: int, size: int, markers: Tuple[bytes, ...] = ()) -> Any:
+    # Cached documents are shared between calls; the merge functions only read
+    # them and build fresh containers via _normalize_ops.
+    # Bytes go straight to libyaml, which handles UTF-8/16 and BOMs itself.
+    data = Path(path_str).read_bytes()
+    # A key can't appear without its bytes unless the file is UTF-16/32 (NULs) encoded.
+    if markers and b"\0" not in data and not any(m in data for m in markers):
+        return None
+    return yaml.load(data, Loader=_YAML_LOADER)
 
 
+@lru_cache(maxsize=8192)
 def _parse_key(key: str, inherited_op: str) -> Tuple[str, str]:
+    # Neither marker fits without a "." in the last len(".replace") characters.
+    if "." not in key[-8:]:
+        return key, inherited_op
     if key.endswith(".add"):
         return key[:-4], ADD
     if key.endswith(".replace"):
@@ -84,11 +136,40 @@ def _normalize_ops(node: Any, inherited: str = REPLACE) -> Tuple[Any, str]:
     return node, inherited
 
 
+def _has_op_markers(node: Any) -> bool:
+    """True if any mapping key in the tree carries a .add/.replace marker."""
+    if isinstance(node, dict):
+        for k, v in cast(Dict[str, Any], node).items():
+            if k.endswith((".add", ".replace")) or _has_op_markers(v):
+                return True
+        return False
+    if isinstance(node, list):
+        return any(_has_op_markers(i) for i in cast(List[Any], node))
+    return False
+
+
+def _canon(x: Any) -> Any:
+    """Hashable structural key for a YAML value; equal keys mean equal YAML documents."""
+    if isinstance(x, dict):
+        return ("d", frozenset((_canon(k), _canon(v)) for k, v in cast(Dict[Any, Any], x).items()))
+    if isinstance(x, list):
+        return ("l", tuple(_canon(i) for i in cast(List[Any], x)))
+    if isinstance(x, float):
+        # repr keeps nan, -0.0 and 1.0 vs 1 apart, as YAML does
+        return ("f", repr(x))
+    try:
+        hash(x)
+    except TypeError:
+        return ("y", yaml.dump(x, sort_keys=True))
+    # type tag keeps 1 / True / "1" distinct
+    return (type(x), x)
+
+
 def _list_unique_extend(base: List[Any], extra: List[Any]) -> List[Any]:
-    seen: Set[str] = set()
+    seen: Set[Any] = set()
     out: List[Any] = []
     for x in base + extra:
-        key = yaml.dump(x, sort_keys=True)
+        key = x if type(x) is str else _canon(x)
         if key not in seen:
             seen.add(key)
             out.append(x)
@@ -111,6 +192,34 @@ def _deep_add(base: Any, overlay: Any) -> Any:
     return overlay
 
 
+def _deep_add_normalized(base: Any, overlay: Any, inherited: str = REPLACE) -> Any:
+    """``_deep_add(base, _normalize_ops(overlay, inherited)[0])`` in a single pass over overlay.
+
+    Dicts in ``base`` are updated in place, so ``base`` must be an accumulator owned by
+    the caller (built only from this function's results); ``overlay`` is never modified.
+    """
+    if isinstance(overlay, dict):
+        if not isinstance(base, dict):
+            return _normalize_ops(overlay, inherited)[0]
+        parsed = [(_parse_key(k, inherited), v) for k, v in cast(Dict[str, Any], overlay).items()]
+        if len({bk for (bk, _), _ in parsed}) != len(parsed):
+            # "x" and "x.add" side by side: normalization keeps only the last one
+            return _deep_add(base, _normalize_ops(overlay, inherited)[0])
+        out = cast(Dict[str, Any], base)
+        for (base_k, child_op), v in parsed:
+            if base_k in out:
+                out[base_k] = _deep_add_normalized(out[base_k], v, child_op)
+            else:
+                out[base_k] = _normalize_ops(v, child_op)[0]
+        return out
+    if isinstance(overlay, list):
+        clean = _normalize_ops(overlay, inherited)[0]
+        if isinstance(base, list):
+            return _list_unique_extend(cast(List[Any], base), clean)
+        return clean
+    return overlay
+
+
 def _apply_overlay_strict_dict(base: Optional[Dict[str, Any]], overlay: Dict[str, Any], op: str, section_name: str = "") -> Dict[str, Any]:
     if base is None:
         base = {}
@@ -125,14 +234,17 @@ def _apply_overlay_strict_dict(base: Optional[Dict[str, Any]], overlay: Dict[str
     return _deep_add(base, overlay)
 
 
+_NLU_MARKERS = (b"nlu", b"version")
+
 DOMAIN_LIST_KEYS = {"intents", "entities", "actions", "e2e_actions"}
+_DOMAIN_DICT_KEYS = ("responses", "slots", "forms", "session_config")
+_DOMAIN_SECTION_KEYS = frozenset(_DOMAIN_DICT_KEYS) | DOMAIN_LIST_KEYS
 
 
 def _merge_domain_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[str, Any]]) -> Dict[str, Any]:
     base: Dict[str, Any] = {}
     for d in base_docs:
-        clean, _ = _normalize_ops(d, REPLACE)
-        base = _deep_add(base, clean)
+        base = _deep_add_normalized(base, d, REPLACE)
 
     for d in overlay_docs:
         # Normalize to strip markers, but capture per-section ops
@@ -144,7 +256,7 @@ def _merge_domain_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[
             clean_top[key] = _normalize_ops(value, sec_op)[0]
 
         # Dict-like sections
-        for section in ("responses", "slots", "forms", "session_config"):
+        for section in _DOMAIN_DICT_KEYS:
             if section in clean_top:
                 base_section = base.get(section, {})
                 op = section_ops.get(section, REPLACE)
@@ -165,7 +277,7 @@ def _merge_domain_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[
 
         # Any other keys -> deep add
         for k, v in clean_top.items():
-            if k in {"responses", "slots", "forms", "session_config"} | DOMAIN_LIST_KEYS:
+            if k in _DOMAIN_SECTION_KEYS:
                 continue
             base[k] = _deep_add(base.get(k), v)
 
@@ -196,12 +308,12 @@ def _merge_nlu_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[str
                 if "intent" in item:
                     by_intent.setdefault(cast(str, item["intent"]), []).append(item)
 
+    # Marker-free docs are only read here, so they can be used without a cleaned copy.
     for d in base_docs:
-        clean, _ = _normalize_ops(d, REPLACE)
-        _feed(clean)
+        _feed(_normalize_ops(d, REPLACE)[0] if _has_op_markers(d) else d)
 
     for d in overlay_docs:
-        clean, parent_op = _normalize_ops(d, REPLACE)
+        clean, parent_op = _normalize_ops(d, REPLACE) if _has_op_markers(d) else (d, REPLACE)
         for raw in cast(List[Any], clean.get("nlu") or []):
             item_raw = cast(Dict[str, Any], raw)
             item, item_op, name_from_marker = _split_intent_op(item_raw, inherited=parent_op)
@@ -232,8 +344,7 @@ def _merge_config_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[
     # Start from combined base (deep add)
     merged: Dict[str, Any] = {}
     for d in base_docs:
-        clean, _ = _normalize_ops(d, REPLACE)
-        merged = _deep_add(merged, clean)
+        merged = _deep_add_normalized(merged, d, REPLACE)
 
     def _merge_in(doc: Dict[str, Any]) -> None:
         clean_top: Dict[str, Any] = {}
@@ -293,13 +404,12 @@ def _merge_config_docs(base_docs: List[Dict[str, Any]], overlay_docs: List[Dict[
 
 
 def _derive_nlu_paths(domain_paths: List[Path]) -> List[Path]:
+    # Candidates only; _resolve_paths drops the ones that don't exist.
     n_paths: List[Path] = []
     for d in domain_paths:
         root = d.parent
         for rel in (Path("data") / "nlu", Path("nlu")):
-            cand = root / rel
-            if cand.exists():
-                n_paths.append(cand)
+            n_paths.append(root / rel)
     return n_paths
 
 
@@ -314,31 +424,130 @@ def _parse_comma_paths(value: Optional[str]) -> List[Path]:
     return out
 
 
-def _uniq_paths(paths: List[Path]) -> List[Path]:
+def _resolve_paths(paths: Iterable[Path]) -> List[str]:
+    """Deduplicated existing directories and YAML files, as strings; each path is stat'ed once."""
     seen: Set[str] = set()
-    out: List[Path] = []
-    for x in paths:
-        sx = str(x)
-        if sx not in seen:
-            seen.add(sx)
-            out.append(x)
+    out: List[str] = []
+    for p in paths:
+        sp = str(p)
+        if sp in seen:
+            continue
+        seen.add(sp)
+        try:
+            st = os.stat(sp)
+        except OSError:
+            continue
+        if stat.S_ISDIR(st.st_mode) or (stat.S_ISREG(st.st_mode) and _is_yaml_name(p.name)):
+            out.append(sp)
     return out
 
 
-def _to_existing_strs(paths: List[Path]) -> List[str]:
-    out: List[str] = []
+_StatKey = Tuple[Tuple[str, int, int], ...]
+
+
+def _domain_stat_key(path: Path) -> _StatKey:
+    """(path, mtime_ns, size) for every YAML file a domain path covers."""
+    key: List[Tuple[str, int, int]] = []
+    for f in sorted(_iter_yaml_files(path)):
+        st = f.stat()
+        key.append((str(f), st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+@lru_cache(maxsize=64)
+def _load_domain_as_dict_cached(path_str: str, stat_key: _StatKey) -> Dict[str, Any]:
+    loaded_domain = cast(Any, Domain).load(path_str)
+    return cast(Dict[str, Any], loaded_domain.as_dict())
+
+
+def _load_domain_as_dict(path: Path, stat_key: _StatKey) -> Dict[str, Any]:
+    # Shared with the cache like _load_yaml_file_cached; _merge_domain_docs never mutates its inputs.
+    return _load_domain_as_dict_cached(str(path), stat_key)
+
+
+def _domain_inputs(paths: List[Path], label: str) -> List[Tuple[Path, _StatKey]]:
+    """Domain paths that contain YAML, each with its stat key (one walk per path)."""
+    out: List[Tuple[Path, _StatKey]] = []
     for p in paths:
-        if p.exists():
-            if p.is_dir():
-                out.append(str(p))
-            elif p.is_file() and p.suffix.lower() in {".yml", ".yaml"}:
-                out.append(str(p))
+        stat_key = _domain_stat_key(p)
+        if not stat_key:
+            logger.info(f"Skipping {label} domain path with no YAML: {p}")
+            continue
+        out.append((p, stat_key))
     return out
 
 
-def _load_domain_as_dict(path: Path) -> Dict[str, Any]:
-    loaded_domain = cast(Any, Domain).load(str(path))
-    return cast(Dict[str, Any], loaded_domain.as_dict())
+def _load_and_merge_domains(base: List[Tuple[Path, _StatKey]], overlay: List[Tuple[Path, _StatKey]]) -> Dict[str, Any]:
+    base_docs: List[Dict[str, Any]] = []
+    for p, stat_key in base:
+        logger.info(f"Loading base domain: {p}")
+        base_docs.append(_load_domain_as_dict(p, stat_key))
+    overlay_docs: List[Dict[str, Any]] = []
+    for p, stat_key in overlay:
+        logger.info(f"Loading overlay domain: {p}")
+        overlay_docs.append(_load_domain_as_dict(p, stat_key))
+    logger.info("Merging domains...")
+    merged = _merge_domain_docs(base_docs, overlay_docs)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Merged domain keys: {list(merged.keys())}")
+        for ov_doc in overlay_docs:
+            for k in ov_doc.keys():
+                if k in merged:
+                    logger.info(f"Overlay key '{k}' present in merged domain.")
+    return merged
+
+
+@lru_cache(maxsize=1)
+def _merge_code_fingerprint() -> str:
+    # Changes to the merge logic must not keep serving domains merged by older code.
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def _domain_cache_file(cache_dir: str, base: List[Tuple[Path, _StatKey]], overlay: List[Tuple[Path, _StatKey]]) -> Path:
+    """One cache file per ordered set of base/overlay paths; edits overwrite it rather than add files."""
+    paths = ([str(p) for p, _ in base], [str(p) for p, _ in overlay])
+    name = hashlib.blake2b(repr(paths).encode("utf-8"), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"merged_domain_{name}.yml"
+
+
+def _domain_fingerprint(base: List[Tuple[Path, _StatKey]], overlay: List[Tuple[Path, _StatKey]]) -> str:
+    """Fingerprint of the Rasa version, this module and every input file's stat."""
+    parts = (
+        getattr(sys.modules.get("rasa"), "__version__", ""),
+        _merge_code_fingerprint(),
+        [(str(p), k) for p, k in base],
+        [(str(p), k) for p, k in overlay],
+    )
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_domain_cache(path: Path, fingerprint: str) -> Optional[Dict[str, Any]]:
+    try:
+        raw = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable domain cache {path}: {e}")
+        return None
+    if not isinstance(raw, dict) or raw.get("fingerprint") != fingerprint:
+        return None
+    domain = raw.get("domain")
+    return cast(Dict[str, Any], domain) if isinstance(domain, dict) else None
+
+
+def _write_domain_cache(path: Path, fingerprint: str, merged: Dict[str, Any]) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            yaml.dump({"fingerprint": fingerprint, "domain": merged}, f, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning(f"Failed to write domain cache {path}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
 
 
 def _build_domain(domain_data: Dict[str, Any]) -> Any:
@@ -349,10 +558,47 @@ def _load_training_data(path: Path) -> Any:
     return cast(Any, nlu_loading).load_data(str(path))
 
 
+def _training_data_from_dict(nlu_doc: Dict[str, Any]) -> Any:
+    text = yaml.dump(nlu_doc, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+    if RasaYAMLReader is not None:
+        return cast(Any, RasaYAMLReader)().reads(text)
+    with tempfile.TemporaryDirectory(prefix="v2_merged_nlu_") as td:
+        tmp = Path(td) / "merged_nlu.yml"
+        tmp.write_text(text, encoding="utf-8")
+        return _load_training_data(tmp)
+
+
 def _build_story_graph(steps: List[Any]) -> Any:
     return cast(Any, StoryGraph)(steps)
 
 
+def _load_config_docs(paths: List[Path], label: str) -> List[Dict[str, Any]]:
+    docs: List[Dict[str, Any]] = []
+    for p in paths:
+        try:
+            raw = yaml.load(p.read_bytes(), Loader=_YAML_LOADER)
+            if isinstance(raw, dict):
+                docs.append(cast(Dict[str, Any], raw))
+        except Exception as e:
+            logger.warning(f"Failed loading {label} config {p}: {e}")
+    return docs
+
+
+def _dump_merged(merged: Dict[str, Any], dump_target: str, label: str) -> None:
+    """Dump a merged document to stdout or a file, as selected by an OVERLAY_DUMP_* value."""
+    try:
+        if dump_target.lower() in {"1", "true", "yes", "stdout"}:
+            yaml.dump(merged, sys.stdout, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+        else:
+            out_path = Path(dump_target)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with out_path.open("w", encoding="utf-8") as f:
+                yaml.dump(merged, f, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+            logger.info(f"Dumped merged {label} to {out_path}")
+    except Exception as e:
+        logger.warning(f"Failed to dump merged {label}: {e}")
+
+
 class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBaseClass]
     def __init__(self, *args: Any, base_domain: Optional[List[str]] = None, overlay_domain: Optional[List[str]] = None, **kwargs: Any):
         cfg: Dict[str, Any] = {}
@@ -382,8 +628,8 @@ class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBas
             if override_paths:
                 self._overlay_domain_paths = override_paths
 
-        self._base_nlu_paths: List[Path] = _derive_nlu_paths(self._base_domain_paths)
-        self._overlay_nlu_paths: List[Path] = _derive_nlu_paths(self._overlay_domain_paths)
+        base_nlu_paths = _derive_nlu_paths(self._base_domain_paths)
+        overlay_nlu_paths = _derive_nlu_paths(self._overlay_domain_paths)
 
         raw_overlay_nlu: Any = cfg.get("overlay_nlu")
         env_overlay_nlu: List[str] = []
@@ -394,22 +640,18 @@ class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBas
                 s = str(p).strip()
                 if s:
                     env_overlay_nlu.append(s)
-        for p in env_overlay_nlu:
-            pp = Path(p)
-            if pp.exists():
-                self._overlay_nlu_paths.append(pp)
+        overlay_nlu_paths.extend(Path(p) for p in env_overlay_nlu)
 
         env_str = os.environ.get("OVERLAY_NLU", "").strip()
         if env_str:
-            for pp in _parse_comma_paths(env_str):
-                self._overlay_nlu_paths.append(pp)
+            overlay_nlu_paths.extend(Path(s.strip()) for s in env_str.split(",") if s.strip())
 
-        self._base_nlu_paths = _uniq_paths(self._base_nlu_paths)
-        self._overlay_nlu_paths = _uniq_paths(self._overlay_nlu_paths)
+        self._base_nlu_paths: List[str] = _resolve_paths(base_nlu_paths)
+        self._overlay_nlu_paths: List[str] = _resolve_paths(overlay_nlu_paths)
         if self._base_nlu_paths:
-            logger.info(f"Base NLU paths: {[str(p) for p in self._base_nlu_paths]}")
+            logger.info(f"Base NLU paths: {self._base_nlu_paths}")
         if self._overlay_nlu_paths:
-            logger.info(f"Overlay NLU paths: {[str(p) for p in self._overlay_nlu_paths]}")
+            logger.info(f"Overlay NLU paths: {self._overlay_nlu_paths}")
 
         # Stories (rules + stories) layering: discover base/overlay story roots (data directories)
         def _story_roots_from_domain_paths(paths: List[Path]) -> List[Path]:
@@ -467,82 +709,47 @@ class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBas
             logger.info(f"Overlay config files: {[str(p) for p in self._overlay_config_paths]}")
 
     def get_domain(self) -> Any:
-        base_docs: List[Dict[str, Any]] = []
-        for p in self._base_domain_paths:
-            if not _has_yaml_under(p):
-                logger.info(f"Skipping base domain path with no YAML: {p}")
-                continue
-            logger.info(f"Loading base domain: {p}")
-            base_docs.append(_load_domain_as_dict(p))
-        overlay_docs: List[Dict[str, Any]] = []
-        for p in self._overlay_domain_paths:
-            if not _has_yaml_under(p):
-                logger.info(f"Skipping overlay domain path with no YAML: {p}")
-                continue
-            logger.info(f"Loading overlay domain: {p}")
-            overlay_docs.append(_load_domain_as_dict(p))
-        logger.info("Merging domains...")
-        merged = _merge_domain_docs(base_docs, overlay_docs)
-        logger.info(f"Merged domain keys: {list(merged.keys())}")
-        for ov_doc in overlay_docs:
-            for k in ov_doc.keys():
-                if k in merged:
-                    logger.info(f"Overlay key '{k}' present in merged domain.")
+        base = _domain_inputs(self._base_domain_paths, "base")
+        overlay = _domain_inputs(self._overlay_domain_paths, "overlay")
+
+        # Optional cross-process cache of the merged domain via OVERLAY_DOMAIN_CACHE=<dir>
+        cache_dir = os.environ.get("OVERLAY_DOMAIN_CACHE", "").strip()
+        cache_file = _domain_cache_file(cache_dir, base, overlay) if cache_dir else None
+        fingerprint = _domain_fingerprint(base, overlay) if cache_file else ""
+        merged = _read_domain_cache(cache_file, fingerprint) if cache_file else None
+        if merged is not None:
+            logger.info(f"Loaded merged domain from cache {cache_file}")
+        else:
+            merged = _load_and_merge_domains(base, overlay)
+            if cache_file:
+                _write_domain_cache(cache_file, fingerprint, merged)
 
         dump_target = os.environ.get("OVERLAY_DUMP_DOMAIN", "").strip()
         if dump_target:
-            try:
-                if dump_target.lower() in {"1", "true", "yes", "stdout"}:
-                    yaml.safe_dump(merged, sys.stdout, sort_keys=False, allow_unicode=True)
-                else:
-                    out_path = Path(dump_target)
-                    out_path.parent.mkdir(parents=True, exist_ok=True)
-                    with out_path.open("w", encoding="utf-8") as f:
-                        yaml.safe_dump(merged, f, sort_keys=False, allow_unicode=True)
-                    logger.info(f"Dumped merged domain to {out_path}")
-            except Exception as e:
-                logger.warning(f"Failed to dump merged domain: {e}")
+            _dump_merged(merged, dump_target, "domain")
         return _build_domain(merged)
 
     def get_nlu_data(self, language: Optional[str] = None) -> Any:
-        base_paths = _to_existing_strs(self._base_nlu_paths)
-        overlay_paths = _to_existing_strs(self._overlay_nlu_paths)
+        base_paths = self._base_nlu_paths
+        overlay_paths = self._overlay_nlu_paths
 
         if not base_paths and not overlay_paths:
-            with tempfile.TemporaryDirectory(prefix="v2_empty_nlu_") as td:
-                tmp = Path(td) / "empty_nlu.yml"
-                with tmp.open("w", encoding="utf-8") as f:
-                    yaml.safe_dump({"version": "3.1", "nlu": []}, f, sort_keys=False, allow_unicode=True)
-                return _load_training_data(tmp)
+            return _training_data_from_dict({"version": "3.1", "nlu": []})
 
         logger.info(f"Merging NLU from base={base_paths} overlays={overlay_paths}")
-        base_docs = _load_yaml_docs([Path(p) for p in base_paths])
-        overlay_docs = _load_yaml_docs([Path(p) for p in overlay_paths])
+        # Only `version` and `nlu` (incl. `nlu.add`/`nlu.replace`) are read from NLU files.
+        base_docs = _load_yaml_docs(base_paths, _NLU_MARKERS)
+        overlay_docs = _load_yaml_docs(overlay_paths, _NLU_MARKERS)
         merged: Dict[str, Any] = _merge_nlu_docs(base_docs, overlay_docs)
-        merged_nlu_list = cast(List[Dict[str, Any]], merged.get("nlu", []))
-        intents = [str(it.get("intent")) for it in merged_nlu_list if it.get("intent")]
-        logger.info(f"Merged NLU intents: {sorted(set(intents))}")
+        if logger.isEnabledFor(logging.INFO):
+            merged_nlu_list = cast(List[Dict[str, Any]], merged.get("nlu", []))
+            intents = {str(it.get("intent")) for it in merged_nlu_list if it.get("intent")}
+            logger.info(f"Merged NLU intents: {sorted(intents)}")
 
         dump_target = os.environ.get("OVERLAY_DUMP_NLU", "").strip()
-        with tempfile.TemporaryDirectory(prefix="v2_merged_nlu_") as td:
-            tmp = Path(td) / "merged_nlu.yml"
-            with tmp.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(merged, f, sort_keys=False, allow_unicode=True)
-
-            if dump_target:
-                try:
-                    if dump_target.lower() in {"1", "true", "yes", "stdout"}:
-                        yaml.safe_dump(merged, sys.stdout, sort_keys=False, allow_unicode=True)
-                    else:
-                        out_path = Path(dump_target)
-                        out_path.parent.mkdir(parents=True, exist_ok=True)
-                        with out_path.open("w", encoding="utf-8") as outf:
-                            yaml.safe_dump(merged, outf, sort_keys=False, allow_unicode=True)
-                        logger.info(f"Dumped merged NLU to {out_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to dump merged NLU: {e}")
-
-            return _load_training_data(tmp)
+        if dump_target:
+            _dump_merged(merged, dump_target, "NLU")
+        return _training_data_from_dict(merged)
 
     def get_stories(self, exclusion_percentage: Optional[int] = None) -> Any:
         # Aggregate story & rule files from base then overlays
@@ -588,25 +795,8 @@ class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBas
         return _build_story_graph(all_steps)
 
     def get_config(self) -> Dict[str, Any]:
-        base_docs: List[Dict[str, Any]] = []
-        for p in self._base_config_paths:
-            try:
-                with p.open("r", encoding="utf-8") as f:
-                    raw = yaml.safe_load(f)
-                    if isinstance(raw, dict):
-                        base_docs.append(cast(Dict[str, Any], raw))
-            except Exception as e:
-                logger.warning(f"Failed loading base config {p}: {e}")
-
-        overlay_docs: List[Dict[str, Any]] = []
-        for p in self._overlay_config_paths:
-            try:
-                with p.open("r", encoding="utf-8") as f:
-                    raw = yaml.safe_load(f)
-                    if isinstance(raw, dict):
-                        overlay_docs.append(cast(Dict[str, Any], raw))
-            except Exception as e:
-                logger.warning(f"Failed loading overlay config {p}: {e}")
+        base_docs = _load_config_docs(self._base_config_paths, "base")
+        overlay_docs = _load_config_docs(self._overlay_config_paths, "overlay")
 
         if not base_docs and not overlay_docs:
             return {}
@@ -616,17 +806,7 @@ class OverlayImporter(TrainingDataImporter):  # pyright: ignore[reportUntypedBas
         # Optional dump support via OVERLAY_DUMP_CONFIG env
         dump_target = os.environ.get("OVERLAY_DUMP_CONFIG", "").strip()
         if dump_target:
-            try:
-                if dump_target.lower() in {"1", "true", "yes", "stdout"}:
-                    yaml.safe_dump(merged, sys.stdout, sort_keys=False, allow_unicode=True)
-                else:
-                    out_path = Path(dump_target)
-                    out_path.parent.mkdir(parents=True, exist_ok=True)
-                    with out_path.open("w", encoding="utf-8") as f:
-                        yaml.safe_dump(merged, f, sort_keys=False, allow_unicode=True)
-                    logger.info(f"Dumped merged config to {out_path}")
-            except Exception as e:
-                logger.warning(f"Failed to dump merged config: {e}")
+            _dump_merged(merged, dump_target, "config")
         return merged
 
     def get_config_file_for_auto_config(self) -> Optional[str]:
@@ -639,4 +819,4 @@ if __name__ == "__main__":
         sys.exit(1)
     importer = OverlayImporter(base_domain=[sys.argv[1]], overlay_domain=[sys.argv[2]])
     merged_domain = importer.get_domain()
-    yaml.safe_dump(cast(Dict[str, Any], merged_domain.as_dict()), sys.stdout, sort_keys=False, allow_unicode=True)
+    yaml.dump(cast(Dict[str, Any], merged_domain.as_dict()), sys.stdout, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Text, cast
 
@@ -14,13 +15,18 @@ from rasa.shared.nlu.training_data.message import Message  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C parser when PyYAML was built against it (falls back to the pure-Python loader).
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+# Runs of whitespace and common separators ("_", "-") collapse to a single space in one pass.
+_SEPARATORS_RE = re.compile(r"[\s_-]+")
+
+
+@lru_cache(maxsize=4096)
 def _norm_text(text: str) -> str:
     # Conservative normalization: keep non-latin characters, but normalize spacing and common separators.
-    s = text.strip().lower()
-    s = s.replace("_", " ").replace("-", " ")
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return _SEPARATORS_RE.sub(" ", text.strip().lower())
 
 
 def _as_list(value: Any) -> List[str]:
@@ -49,7 +55,16 @@ class _SSOTIndex:
 
 
 def _load_ssot_index(path: Path) -> _SSOTIndex:
-    """Loads a SSOT YAML file into a synonym->canonical index.
+    """Loads a SSOT YAML file into a synonym->canonical index, reusing the parsed index while the file is unchanged."""
+    st = path.stat()
+    return _load_ssot_index_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _load_ssot_index_cached(path_str: str, mtime_ns: int, size: int) -> _SSOTIndex:
+    """Parses a SSOT YAML file into a synonym->canonical index.
+
+    Keyed on (path, mtime, size) so edited files are re-parsed.
 
     Expected SSOT shape: a YAML list of items with keys like:
       - canonical: <CODE>
@@ -59,7 +74,7 @@ def _load_ssot_index(path: Path) -> _SSOTIndex:
     enum keys + their synonyms as valid synonyms for that canonical as well.
     """
 
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    raw = yaml.load(Path(path_str).read_bytes(), Loader=_YAML_LOADER)
     items: List[Dict[str, Any]] = []
     if isinstance(raw, list):
         raw_list = cast(List[Any], raw)
@@ -104,6 +119,18 @@ def _load_ssot_index(path: Path) -> _SSOTIndex:
     return _SSOTIndex(canonicals=canonicals, by_synonym=by_synonym)
 
 
+DEFAULT_ENTITY_SSOT_FILES: Dict[str, str] = {
+    "metric": "MetricType.yml",
+    "chart_type": "ChartType.yml",
+    "group_by": "GroupByType.yml",
+    "operator_type": "OperatorType.yml",
+    "sex": "SexType.yml",
+    "stroke_type": "StrokeType.yml",
+    "boolean_type": "BooleanType.yml",
+    "statistical_test_type": "StatisticalTestType.yml",
+}
+
+
 @DefaultV1Recipe.register(DefaultV1Recipe.ComponentType.ENTITY_EXTRACTOR, is_trainable=False)
 class SSOTCanonicalizer(GraphComponent):
     """Normalizes SSOT-backed entity values to canonical codes.
@@ -123,19 +150,7 @@ class SSOTCanonicalizer(GraphComponent):
         self._ssot_dir = ssot_dir
 
         # Entity -> SSOT file mapping
-        mapping_any = self._config.get(
-            "entity_ssot_files",
-            {
-                "metric": "MetricType.yml",
-                "chart_type": "ChartType.yml",
-                "group_by": "GroupByType.yml",
-                "operator_type": "OperatorType.yml",
-                "sex": "SexType.yml",
-                "stroke_type": "StrokeType.yml",
-                "boolean_type": "BooleanType.yml",
-                "statistical_test_type": "StatisticalTestType.yml",
-            },
-        )
+        mapping_any = self._config.get("entity_ssot_files", DEFAULT_ENTITY_SSOT_FILES)
         self._entity_ssot_files: Dict[str, str] = {str(k): str(v) for k, v in cast(Dict[str, Any], mapping_any).items()}
 
         # Which entities are strict (unmapped values are dropped). Default: only `metric`.
@@ -182,7 +197,8 @@ class SSOTCanonicalizer(GraphComponent):
             for ent_any in cast(List[Any], entities_any):
                 if not isinstance(ent_any, dict):
                     continue
-                ent = dict(cast(Dict[str, Any], ent_any))
+                # Copy-on-write: entities passed through unchanged are not copied.
+                ent = cast(Dict[str, Any], ent_any)
 
                 entity_name = str(ent.get("entity") or "")
                 if not entity_name:
@@ -191,7 +207,7 @@ class SSOTCanonicalizer(GraphComponent):
 
                 # Migration shim: kpi -> metric
                 if entity_name == "kpi":
-                    ent["entity"] = "metric"
+                    ent = {**ent, "entity": "metric"}
                     entity_name = "metric"
 
                 idx = self._indexes.get(entity_name)
@@ -214,8 +230,7 @@ class SSOTCanonicalizer(GraphComponent):
                     continue
 
                 if mapped != raw_val:
-                    ent["_ssot_raw_value"] = raw_val
-                    ent["value"] = mapped
+                    ent = {**ent, "_ssot_raw_value": raw_val, "value": mapped}
                 new_entities.append(ent)
 
             message_any.set("entities", new_entities)